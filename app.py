@@ -7,25 +7,65 @@ contains the API quote fetching logic.
 """
 # Import necessary libraries
 import json
+import math
+import os
+import time
 import tkinter as tk
-from tkinter import messagebox
-from datetime import datetime, timedelta
+from tkinter import messagebox, ttk
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 
-from quotes import get_quote
+from quotes import get_quote_async, prefetch_quote
 import config as cfg
 
-# ================
-# UTILITY FUNCTION
-# ================
+# orjson is optional, when installed it reads and writes the data file faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# =================
+# UTILITY FUNCTIONS
+# =================
+def dumps_json(data):
+    """Converts data into indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+def loads_json(raw):
+    """Converts JSON bytes back into data."""
+    if orjson is not None:
+        return orjson.loads(raw)   # orjson's errors are also json.JSONDecodeError
+    return json.loads(raw)
+
+# Every MM:SS string up to 3 hours, built once so the timer display is a simple lookup
+_TIME_STRINGS = tuple(f"{s//60:02d}:{s%60:02d}" for s in range(3 * 60 * 60 + 1))
+
 def format_time(seconds):
     """Converts a total number of seconds into a MM:SS string."""
+    if 0 <= seconds < len(_TIME_STRINGS):
+        return _TIME_STRINGS[seconds]
+    # Longer sessions than that are formatted on the fly
     return f"{seconds//60:02d}:{seconds%60:02d}"
 
+# Daily counts shown for a week without any sessions (Monday to Sunday)
+_NO_SESSIONS = (0,) * 7
+
 # ============
 # CORE CLASSES
 # ============
 class PomodoroTimer:
     """Manages all timing logic and state for the timer."""
+    # This dictionary translates the simple session type names into the keys
+    # used in the settings file, making the code cleaner
+    _KEY_MAP = {'work': 'work_duration',
+                'short_break': 'short_break',
+                'long_break': 'long_break'}
+    # The timer only ever has these attributes, so Python can store them without a per-instance dict
+    __slots__ = ("settings", "state", "session_type", "time_left", "completed_sessions",
+                 "_deadline", "_remaining", "_durations_seconds", "_sessions_per_long_break")
+
     def __init__(self, settings):
         # Store the timer settings passed from the main app
         self.settings = settings
@@ -34,24 +74,55 @@ class PomodoroTimer:
 
     def reset(self):
         """Resets the timer to its initial, idle state."""
+        # Convert the durations from the user's settings to seconds
+        self.apply_settings(self.settings)
         # What the timer is doing: idle, running or paused
         self.state = 'idle'
         # The session type tracks whether we are in a work period or a break
         self.session_type = 'work'
-        # Calculate the starting time in seconds from user's settings
-        self.time_left = self.settings["work_duration"] * 60
+        # Get the starting time in seconds
+        self.time_left = self._get_duration_for_session()
         # Reset the count of completed work sessions
         self.completed_sessions = 0
+        # The clock time (time.monotonic) at which a running session ends
+        self._deadline = None
+        # The exact seconds left when paused, so resuming doesn't lose or gain part of a second
+        self._remaining = None
+
+    def apply_settings(self, settings):
+        """Stores new settings and works out the session durations in seconds."""
+        self.settings = settings
+        self._durations_seconds = {session_type: settings[key] * 60
+                                   for session_type, key in self._KEY_MAP.items()}
+        # How many work sessions are required for a long break
+        self._sessions_per_long_break = settings["sessions_per_long_break"]
 
     def start(self):
         """Changes the timer's state to 'running' if it is not already."""
         if self.state != 'running':
+            # A finished session has no time left, so start it again from its full duration
+            if self.exact_time_left() <= 0:
+                self.set_session(self.session_type)
+            # Remember when the session will end, the time left is then read from the clock
+            self._deadline = time.monotonic() + self.exact_time_left()
+            self._remaining = None
             self.state = 'running'
 
     def pause(self):
         """Changes the timer's state to 'paused' if it is currently running."""
         if self.state == 'running':
+            # Keep the exact time that is left so starting again continues from here,
+            # the display shows it rounded up to whole seconds
+            self._remaining = self.exact_time_left()
+            self.time_left = math.ceil(self._remaining)
             self.state = 'paused'
+            self._deadline = None
+
+    def exact_time_left(self):
+        """Returns the precise number of seconds left, as a float."""
+        if self.state != 'running':
+            return self._remaining if self._remaining is not None else float(self.time_left)
+        return max(0.0, self._deadline - time.monotonic())
 
     def set_session(self, session_type):
         """Sets up the timer for a new session type and makes it idle."""
@@ -61,15 +132,17 @@ class PomodoroTimer:
         self.session_type = session_type
         # Load the duration for this new session type
         self.time_left = self._get_duration_for_session()
+        self._deadline = None
+        self._remaining = None
 
     def tick(self):
-        """Decrements the timer by one second if it is running."""
+        """Updates the time left from the clock if the timer is running."""
         # It exits early if there's nothing to do
         if self.state != 'running' or self.time_left <= 0:
             return None
 
-        # Count down by one
-        self.time_left -= 1
+        # Round up, so the display only shows 00:00 once the time is really over
+        self.time_left = math.ceil(self.exact_time_left())
 
         # If the timer is still ticking skip
         if self.time_left > 0:
@@ -77,6 +150,7 @@ class PomodoroTimer:
 
         # If we reach here, the timer just hit zero
         self.state = 'idle'   # The timer is now finished
+        self._deadline = None
         if self.session_type == 'work':
             # Increment the counter after a work session is completed
             self.completed_sessions += 1
@@ -87,36 +161,25 @@ class PomodoroTimer:
 
     def get_next_break_type(self):
         """Determines if the next break should be a long break or a short break."""
-        # Get the user's setting for how many work sessions are required
-        sessions_for_long_break = self.settings["sessions_per_long_break"]
-
-        # Rule 1: You don't get a long break if no sessions are completed
-        if self.completed_sessions == 0:
-            return 'short_break'
-
-        # Rule 2: Check if the number of completed sessions is an exact multiple of `sessions_for_long_break`
-        if self.completed_sessions % sessions_for_long_break == 0:
-            # If it's an exact multiple, it's time for a long break
+        # It's a long break when at least one session is completed and the number of completed
+        # sessions is an exact multiple of `_sessions_per_long_break`, otherwise it's a short break
+        if self.completed_sessions and self.completed_sessions % self._sessions_per_long_break == 0:
             return 'long_break'
-        else:
-            # Otherwise, it's a short break
-            return 'short_break'
+        return 'short_break'
 
     def _get_duration_for_session(self):
         """Returns the duration in seconds for the current session type."""
-        # This dictionary translates the simple session type names into the keys
-        # used in the settings file, making the code cleaner
-        key_map = {'work': 'work_duration',
-                   'short_break': 'short_break',
-                   'long_break': 'long_break'}
-        
-        duration_key = key_map[self.session_type]
-        # Get the duration in minutes from settings and convert it to seconds
-        return self.settings[duration_key] * 60
+        return self._durations_seconds[self.session_type]
 
 
 class SettingsWindow(tk.Toplevel):
     """The popup window for configuring application settings."""
+    # How long to wait after the last keystroke before saving the settings to file
+    SAVE_DELAY_MS = 400
+    # The auto start button only has two possible texts, so they are formatted once
+    _AUTO_START_TEXT = {True: cfg.STRINGS['settings_auto_start_format'].format("ON"),
+                        False: cfg.STRINGS['settings_auto_start_format'].format("OFF")}
+
     def __init__(self, parent, main_app):
         # Initialize this window as a Toplevel window (a popup)
         super().__init__(parent)
@@ -124,8 +187,20 @@ class SettingsWindow(tk.Toplevel):
         self.geometry(cfg.SETTINGS_WINDOW_SIZE)    # Window size from config file
         self.main_app = main_app   # Store a reference to the main application to call its methods
         self.app_data = main_app.app_data  # Get a direct reference to the app's data for easy access
+        self._saved_settings = dict(self.app_data["settings"])  # The settings as they are in the file
+        self._save_job = None  # The id of the pending save, if any
+        self.protocol("WM_DELETE_WINDOW", self._on_close)  # Apply the last edits when the window is closed
         self._create_interface()  # Build the UI for this window.
 
+    def show(self):
+        """Shows the window again with the current settings."""
+        for key, var in self.setting_vars.items():
+            var.set(str(self.app_data["settings"][key]))
+        self.pin_button.config(text=cfg.STRINGS['btn_unpin'] if self.main_app.window_pinned else cfg.STRINGS['btn_pin'])
+        self.auto_button.config(text=self._AUTO_START_TEXT[self.app_data['settings']['auto_start']])
+        self.deiconify()
+        self.lift()
+
     def _create_interface(self):
         """Builds all the visual elements (widgets) for the settings window."""
         frame = tk.Frame(self)
@@ -142,16 +217,20 @@ class SettingsWindow(tk.Toplevel):
             {'label': cfg.STRINGS['settings_sessions_label'], 'key': "sessions_per_long_break", 'unit': cfg.STRINGS['settings_sessions_unit']}
         ]
         self.setting_vars = {}
+        # Tkinter checks every edit with this command and rejects anything that is not a number
+        validate_command = (self.register(self._is_number_input), "%P")
         # Loop through our configuration list to build the UI grid
         for i, config in enumerate(settings_config):
             # Create the text label
             tk.Label(durations_frame, text=config['label'], font=cfg.FONT_SETTINGS_LABEL).grid(row=i, column=0, sticky="w", **cfg.SETTINGS_DURATIONS_GRID_PADDING)
             var = tk.StringVar(value=str(self.app_data["settings"][config['key']]))
             # Create the entry box where the user types a number
-            entry = tk.Entry(durations_frame, width=cfg.SETTINGS_ENTRY_WIDTH, textvariable=var, font=cfg.FONT_SETTINGS_ENTRY, justify="center")
+            entry = tk.Entry(durations_frame, width=cfg.SETTINGS_ENTRY_WIDTH, textvariable=var, font=cfg.FONT_SETTINGS_ENTRY, justify="center",
+                             validate="key", validatecommand=validate_command)
             entry.grid(row=i, column=1, **cfg.SETTINGS_DURATIONS_GRID_PADDING)
-            # The bind method tells the entry box to call our function whenever the user types
-            entry.bind("<KeyRelease>", self._on_settings_change)
+            # The bind method tells the entry box to call our function when the user is done editing
+            entry.bind("<FocusOut>", self._on_settings_change)
+            entry.bind("<Return>", self._on_settings_change)
             self.setting_vars[config['key']] = var
             tk.Label(durations_frame, text=config['unit'], font=cfg.FONT_SETTINGS_LABEL, fg=cfg.COLOR_TEXT_SECONDARY).grid(row=i, column=2, sticky="w", **cfg.SETTINGS_DURATIONS_GRID_PADDING)
 
@@ -161,7 +240,7 @@ class SettingsWindow(tk.Toplevel):
         pin_text = cfg.STRINGS['btn_unpin'] if self.main_app.window_pinned else cfg.STRINGS['btn_pin']
         self.pin_button = tk.Button(controls_frame, text=pin_text, command=self._toggle_pin, width=cfg.SETTINGS_BUTTON_WIDTH, font=cfg.FONT_BUTTON)
         self.pin_button.pack(side=tk.LEFT, **cfg.SETTINGS_BUTTON_INTERNAL_PADDING)
-        auto_text = cfg.STRINGS['settings_auto_start_format'].format("ON" if self.app_data['settings']['auto_start'] else "OFF")
+        auto_text = self._AUTO_START_TEXT[self.app_data['settings']['auto_start']]
         self.auto_button = tk.Button(controls_frame, text=auto_text, command=self._toggle_auto_start, width=cfg.SETTINGS_BUTTON_WIDTH, font=cfg.FONT_BUTTON)
         self.auto_button.pack(side=tk.RIGHT, **cfg.SETTINGS_BUTTON_INTERNAL_PADDING)
 
@@ -171,6 +250,16 @@ class SettingsWindow(tk.Toplevel):
         tk.Button(actions_frame, text=cfg.STRINGS['btn_reset_timer'], command=self.main_app.reset_timer, width=cfg.SETTINGS_BUTTON_WIDTH, font=cfg.FONT_BUTTON).pack(side=tk.LEFT, **cfg.SETTINGS_BUTTON_INTERNAL_PADDING)
         tk.Button(actions_frame, text=cfg.STRINGS['btn_reset_stats'], command=self.main_app.reset_stats, width=cfg.SETTINGS_BUTTON_WIDTH, font=cfg.FONT_BUTTON).pack(side=tk.RIGHT, **cfg.SETTINGS_BUTTON_INTERNAL_PADDING)
 
+    @staticmethod
+    def _is_number_input(text):
+        """Allows an edit only if the entry box would contain digits (or nothing) afterwards."""
+        return text == "" or text.isdigit()
+
+    def _on_close(self):
+        """Applies any edits still in the entry boxes, then hides the window so it can be shown again."""
+        self._on_settings_change()
+        self.withdraw()
+
     def _toggle_pin(self):
         """Toggles the main window's 'always on top' state."""
         # Flip the boolean value (True becomes False, and vice-versa)
@@ -187,12 +276,16 @@ class SettingsWindow(tk.Toplevel):
         # Set the setting to the opposite of its current state
         self.app_data["settings"]["auto_start"] = not is_on
         # Save the change to the data.json file
+        self.main_app._dirty = True
         self.main_app._save_data()
+        self._saved_settings = dict(self.app_data["settings"])
         # Update the button's text to show the new state
-        self.auto_button.config(text=cfg.STRINGS['settings_auto_start_format'].format("ON" if not is_on else "OFF"))
+        self.auto_button.config(text=self._AUTO_START_TEXT[not is_on])
 
     def _on_settings_change(self, event=None):
-        """Validates and saves settings as the user types."""
+        """Validates and saves settings when the user is done editing a field."""
+        settings = self.app_data["settings"]
+        pending = {}   # The valid new values, applied together after all fields are checked
         for key, var in self.setting_vars.items():
             try:
                 # Step 1: Attempt to convert the input text to a number.
@@ -204,15 +297,38 @@ class SettingsWindow(tk.Toplevel):
                     # If not positive, we treat it as an error. We can force a jump to the 'except'
                     raise ValueError()
 
-                # If both checks pass, we update the app's data with the new number
-                self.app_data["settings"][key] = value
+                # If both checks pass and the number is new, we keep it for the update
+                if value != settings[key]:
+                    pending[key] = value
 
             except ValueError:
                 # We revert the entry box to its last known good value if no valid input
-                var.set(str(self.app_data["settings"][key]))
-        
-        # After checking all fields, save any changes that were made
+                var.set(str(settings[key]))
+
+        # Nothing to do if none of the values changed
+        if not pending:
+            return
+        settings.update(pending)
+
+        # Nothing to save if the values are back to what is in the file
+        if settings == self._saved_settings:
+            if self._save_job is not None:
+                self.main_app.root.after_cancel(self._save_job)
+                self._save_job = None
+            return
+
+        # Wait a moment before saving, so a burst of edits is a single write.
+        # It is scheduled on the main window, so it still runs if this window is closed.
+        if self._save_job is not None:
+            self.main_app.root.after_cancel(self._save_job)
+        self._save_job = self.main_app.root.after(self.SAVE_DELAY_MS, self._save_settings)
+
+    def _save_settings(self):
+        """Saves the settings to file once the user has stopped typing."""
+        self._save_job = None
+        self.main_app._dirty = True
         self.main_app._save_data()
+        self._saved_settings = dict(self.app_data["settings"])
 
 
 class StatsWindow(tk.Toplevel):
@@ -224,9 +340,23 @@ class StatsWindow(tk.Toplevel):
         self.configure(bg=cfg.COLOR_STATS_WINDOW_BG)
         self.resizable(False, False)
         self.sessions = sessions
-        self.week_offset = 0
+        # Closing the window only hides it, so it can be shown again without rebuilding it
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        self._title_cache = {}   # The date range text of each week already shown
+        # Keep the window hidden while it is built, so tkinter lays it out once at the end
+        self.withdraw()
         self._create_interface()
+        self.show()
+
+    def show(self):
+        """Shows the window on the current week with up to date counts."""
+        self.week_offset = 0
+        # Count the sessions per ISO week once, so switching weeks is a simple lookup
+        self._week_counts = self._count_sessions_by_week(self.sessions)
         self._update_display()
+        self.update_idletasks()
+        self.deiconify()
+        self.lift()
 
     def _create_interface(self):
         """Builds the widgets for the stats window."""
@@ -238,18 +368,25 @@ class StatsWindow(tk.Toplevel):
         self.week_label = tk.Label(nav_frame, font=cfg.FONT_STATS_TITLE, fg=cfg.COLOR_STATS_TEXT, bg=cfg.COLOR_STATS_WINDOW_BG)
         self.week_label.grid(row=1, column=0, columnspan=2, **cfg.STATS_TITLE_PADDING)
 
-        # Create a frame to hold the rows of daily stats
+        # Create a frame to hold the table of daily stats
         stats_frame = tk.Frame(self, bg=cfg.COLOR_STATS_WINDOW_BG)
         stats_frame.pack(fill=tk.BOTH, expand=True, **cfg.STATS_DAYS_FRAME_PADDING)
-        self.count_labels = []
-        for day in cfg.STRINGS['stats_weekdays']:
-            row = tk.Frame(stats_frame, bg=cfg.COLOR_STATS_ROW_BG)
-            row.pack(fill=tk.X, **cfg.STATS_DAY_ROW_PADDING)
-            tk.Label(row, text=day, font=cfg.FONT_STATS_DAY_LABEL, fg=cfg.COLOR_STATS_TEXT, bg=cfg.COLOR_STATS_ROW_BG, anchor="w", width=cfg.STATS_DAY_LABEL_WIDTH).pack(side=tk.LEFT, padx=cfg.STATS_ROW_INTERNAL_PADDING_X)
-            lbl = tk.Label(row, text="0", font=cfg.FONT_STATS_COUNT, fg=cfg.COLOR_STATS_TEXT, bg=cfg.COLOR_STATS_ROW_BG, width=cfg.STATS_COUNT_LABEL_WIDTH, anchor="e")
-            lbl.pack(side=tk.LEFT, padx=cfg.STATS_ROW_INTERNAL_PADDING_X)
-            self.count_labels.append(lbl)
-            tk.Label(row, text=cfg.STRINGS['stats_session_icon'], font=cfg.FONT_STATS_COUNT, bg=cfg.COLOR_STATS_ROW_BG).pack(side=tk.RIGHT, padx=cfg.STATS_ROW_INTERNAL_PADDING_X)
+
+        # A single Treeview draws all 7 rows, instead of a frame and three labels per day
+        style = ttk.Style(self)
+        style.configure("Stats.Treeview", font=cfg.FONT_STATS_DAY_LABEL, rowheight=cfg.STATS_TABLE_ROW_HEIGHT, borderwidth=0,
+                        foreground=cfg.COLOR_STATS_TEXT, background=cfg.COLOR_STATS_ROW_BG, fieldbackground=cfg.COLOR_STATS_WINDOW_BG)
+        style.layout("Stats.Treeview", [("Stats.Treeview.treearea", {'sticky': 'nswe'})])  # No border around the table
+        self.days_table = ttk.Treeview(stats_frame, style="Stats.Treeview", columns=("count", "icon"), show="tree",
+                                       height=len(cfg.STRINGS['stats_weekdays']), selectmode="none")
+        self.days_table.column("#0", width=cfg.STATS_DAY_COLUMN_WIDTH, anchor="w")
+        self.days_table.column("count", width=cfg.STATS_COUNT_COLUMN_WIDTH, anchor="e")
+        self.days_table.column("icon", width=cfg.STATS_ICON_COLUMN_WIDTH, anchor="e")
+        self.days_table.pack(fill=tk.BOTH, expand=True)
+        # The row ids are the day indexes (0 for Monday, 1 for Tuesday, etc)
+        days_table, icon = self.days_table, cfg.STRINGS['stats_session_icon']
+        for i, day in enumerate(cfg.STRINGS['stats_weekdays']):
+            days_table.insert("", tk.END, iid=str(i), text=day, values=(0, icon))
 
         # Create the weekly total banner at the bottom
         total_frame = tk.Frame(self, bg=cfg.COLOR_STATS_WINDOW_BG)
@@ -257,6 +394,25 @@ class StatsWindow(tk.Toplevel):
         self.total_label = tk.Label(total_frame, font=cfg.FONT_STATS_TOTAL, fg=cfg.COLOR_STATS_TEXT, bg=cfg.COLOR_STATS_TOTAL_BANNER_BG)
         self.total_label.pack(fill=tk.X, **cfg.STATS_TOTAL_BANNER_PADDING)
 
+    def add_session(self, session_date):
+        """Counts a newly completed session, redrawing the stats if the window is open."""
+        year, week, weekday = session_date.isocalendar()
+        self._week_counts[(year, week)][weekday - 1] += 1
+        if self.state() != 'withdrawn':
+            self._update_display()
+
+    @staticmethod
+    def _count_sessions_by_week(sessions):
+        """Groups the sessions into a {(iso_year, iso_week): [Mon..Sun counts]} map."""
+        week_counts = defaultdict(lambda: [0] * 7)
+        for session in sessions:
+            try:
+                year, week, weekday = date(*session["date"]).isocalendar()
+            except (KeyError, ValueError, TypeError):
+                continue   # Skip sessions that can't be read, they stay in the file untouched
+            week_counts[(year, week)][weekday - 1] += 1   # isocalendar() returns 1 for Monday
+        return week_counts
+
     def _change_week(self, direction):
         """Navigates the week view forward or backward."""
         self.week_offset += direction
@@ -264,29 +420,28 @@ class StatsWindow(tk.Toplevel):
 
     def _update_display(self):
         """Refreshes the stats display for the current week in three simple steps."""
-        # Determine the week's date range
+        # Determine the week's start date
         today = datetime.now().date()
         start_of_week = today - timedelta(days=today.weekday()) + timedelta(weeks=self.week_offset)
-        end_of_week = start_of_week + timedelta(days=6)
-
-        # Count the sessions that fall within this range
-        counts_per_day = [0] * 7   # Create a list of 7 zeros (Monday to Sunday)
-        for session in self.sessions:
-            session_date = datetime.fromisoformat(session["timestamp"]).date()
-            # Check if the session is inside our target week
-            if start_of_week <= session_date <= end_of_week:
-                day_index = session_date.weekday() # Returns 0 for Monday, 1 for Tuesday, etc
-                counts_per_day[day_index] += 1     # Add 1 to the correct day's count
-
-        # Update the UI labels with the results
-        self.week_label.config(text=cfg.STRINGS['stats_date_range_format'].format(
-            start_date=start_of_week.strftime('%B %d'),
-            end_date=end_of_week.strftime('%B %d, %Y')
-        ))
-
-        # Update each of the 7 daily count labels on the screen
+
+        # Look up the daily counts for this week (a week with no sessions gets all zeros)
+        year, week, _ = start_of_week.isocalendar()
+        counts_per_day = self._week_counts.get((year, week), _NO_SESSIONS)
+
+        # Update the UI labels with the results, the date range text is only built the first time a week is shown
+        title = self._title_cache.get((year, week))
+        if title is None:
+            end_of_week = start_of_week + timedelta(days=6)
+            title = self._title_cache[(year, week)] = cfg.STRINGS['stats_date_range_format'].format(
+                start_date=start_of_week.strftime('%B %d'),
+                end_date=end_of_week.strftime('%B %d, %Y')
+            )
+        self.week_label.config(text=title)
+
+        # Update each of the 7 daily counts in the table
+        days_table, icon = self.days_table, cfg.STRINGS['stats_session_icon']
         for i, count in enumerate(counts_per_day):
-            self.count_labels[i].config(text=str(count))
+            days_table.item(str(i), values=(count, icon))
 
         # Update the total at the bottom by summing the daily counts
         total = sum(counts_per_day)
@@ -295,22 +450,51 @@ class StatsWindow(tk.Toplevel):
 
 class MainWindow:
     """The main application class that orchestrates all components."""
+    # How often to check whether a quote being fetched has arrived
+    QUOTE_CHECK_MS = 100
+
+    # This dictionary maps the timer's (session type, state) directly to the text needed for the labels and buttons
+    _UI_MAP = {
+        ('work', 'idle'):            (cfg.STATUS_READY, cfg.BTN_START_WORK, cfg.BTN_START_BREAK),
+        ('work', 'running'):         (cfg.STATUS_WORKING, cfg.BTN_PAUSE_WORK, cfg.BTN_START_BREAK),
+        ('work', 'paused'):          (cfg.STATUS_WORK_PAUSED, cfg.BTN_START_WORK, cfg.BTN_START_BREAK),
+        ('short_break', 'idle'):     (cfg.STATUS_READY, cfg.BTN_START_WORK, cfg.BTN_START_BREAK),
+        ('short_break', 'running'):  (cfg.STATUS_BREAK, cfg.BTN_START_WORK, cfg.BTN_PAUSE_BREAK),
+        ('short_break', 'paused'):   (cfg.STATUS_BREAK_PAUSED, cfg.BTN_START_WORK, cfg.BTN_START_BREAK),
+        ('long_break', 'idle'):      (cfg.STATUS_READY, cfg.BTN_START_WORK, cfg.BTN_START_BREAK),
+        ('long_break', 'running'):   (cfg.STATUS_BREAK, cfg.BTN_START_WORK, cfg.BTN_PAUSE_BREAK),
+        ('long_break', 'paused'):    (cfg.STATUS_BREAK_PAUSED, cfg.BTN_START_WORK, cfg.BTN_START_BREAK),
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title(cfg.STRINGS['title_main'])
         self.root.geometry(cfg.MAIN_WINDOW_SIZE)
         self.root.resizable(False, False)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)  # Save unsaved settings before quitting
 
+        self._dirty = False   # True when app_data has changes that are not saved to file yet
         self.app_data = self._load_data()
         self.timer = PomodoroTimer(self.app_data["settings"])
+        # Write back any dates added while loading
+        self._save_data()
 
         self.window_pinned = False
         self.settings_window = None
-
-        # Build the UI, get the first quote and start the main timer loop
+        self.stats_window = None   # Created the first time the stats are shown
+        # The id of the scheduled timer update, only set while the timer is running
+        self._update_job = None
+        # The texts currently shown by the timer display, status label and the two buttons
+        self._last_ui = (None, None, None, None)
+        # Quotes are fetched on a background thread, so a slow network never freezes the window
+        self._quote_future = None   # The quote fetch in progress, if any
+
+        # Build the UI and show the timer
         self._create_interface()
-        self.refresh_quote()
         self._update_loop()
+        # Only fetch the first quote once the window is drawn, so it appears right away
+        self.quote_label.config(text=cfg.STRINGS['quote_loading'])
+        self.root.after_idle(self.refresh_quote)
 
     def _load_data(self):
         """
@@ -320,19 +504,16 @@ class MainWindow:
         try:
             # Attempt to open and read the data file
             # This will fail if the file doesn't exist (FileNotFoundError)
-            with open(cfg.DATA_FILE, 'r') as f:
+            with open(cfg.DATA_FILE, 'rb') as f:
                 # Attempt to parse the file as JSON.
                 # This will fail if the file is empty or has broken syntax (JSONDecodeError)
-                data = json.load(f)
+                data = loads_json(f.read())
 
             # Check if the data has the structure we expect
             # Accessing the keys will fail if they don't exist (KeyError)
             _ = data['settings']
             _ = data['sessions']
 
-            # If all three steps succeed, the data is valid
-            return data
-
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
             # Catches ANY error that occurs during loading
             messagebox.showwarning(
@@ -348,19 +529,57 @@ class MainWindow:
             # Return the default data for use in the app
             return default_data
 
+        # If all three steps succeed, the data is valid
+        self._add_session_dates(data['sessions'])
+        return data
+
+    def _add_session_dates(self, sessions):
+        """
+        Adds the [year, month, day] date to sessions that only have a timestamp. Older files
+        only stored the timestamp, so the date is added once here to spare the stats window
+        from parsing every timestamp string. Unreadable sessions are left as they are,
+        the stats window skips them.
+        """
+        for session in sessions:
+            try:
+                if "date" not in session:
+                    session_time = datetime.fromisoformat(session["timestamp"])
+                    session["date"] = [session_time.year, session_time.month, session_time.day]
+                    self._dirty = True   # Save the added date, so this only happens once
+            except (KeyError, ValueError, TypeError):
+                pass
+
     def _save_data(self, data=None):
-        """Saves the current app data to file and syncs the timer."""
+        """Saves the current app data to file (if it changed) and syncs the timer."""
         # If specific data is passed, save that. Otherwise, save the app's current data.
         data_to_save = data if data is not None else self.app_data
-        try:
-            with open(cfg.DATA_FILE, 'w') as f:
-                json.dump(data_to_save, f, indent=2)
-        except IOError as e:
-            messagebox.showinfo("Error", f"Could not save data file:\n{e}", parent=self.root)
+        if data is not None or self._dirty:
+            try:
+                # Write to a temporary file first and then swap it in, so a crash
+                # halfway through never leaves a broken data file behind
+                temp_file = cfg.DATA_FILE + ".tmp"
+                with open(temp_file, 'wb') as f:
+                    f.write(dumps_json(data_to_save))
+                os.replace(temp_file, cfg.DATA_FILE)
+                if data is None:
+                    self._dirty = False
+            except IOError as e:
+                messagebox.showinfo("Error", f"Could not save data file:\n{e}", parent=self.root)
 
         # If we saved the app's current data, make sure the timer object is updated.
         if data is None:
-            self.timer.settings = self.app_data["settings"]
+            self.timer.apply_settings(self.app_data["settings"])
+
+    def _on_close(self):
+        """Saves any settings still being edited or waiting to be saved, then closes the app."""
+        if self.settings_window and self.settings_window.winfo_exists():
+            # Apply what is typed in the entry boxes, even if they never lost focus
+            self.settings_window._on_settings_change()
+            # Save right away instead of waiting for the delayed save
+            if self.settings_window._save_job is not None:
+                self.root.after_cancel(self.settings_window._save_job)
+                self.settings_window._save_settings()
+        self.root.destroy()
 
     def _create_interface(self):
         """Builds the main user interface."""
@@ -409,6 +628,7 @@ class MainWindow:
             self.timer.pause()
         else: # This handles both 'idle' and 'paused' states
             self.timer.start()
+        self._schedule_update()
 
     def toggle_break(self):
         """Handles clicks on the 'Start/Pause Break' button."""
@@ -420,23 +640,30 @@ class MainWindow:
             self.timer.pause()
         else: # This handles both 'idle' and 'paused' states
             self.timer.start()
+        self._schedule_update()
 
     def reset_timer(self):
         """Resets the timer to its initial state."""
         self.timer.reset()
+        self._schedule_update()
 
     def show_settings(self):
         """Opens the settings window, ensuring only one instance can exist."""
-        # If the settings window already exists, just bring it to the front
+        # If the settings window already exists, show it again and bring it to the front
         if self.settings_window and self.settings_window.winfo_exists():
-            self.settings_window.lift()
+            self.settings_window.show()
         else:
-            # Otherwise, create a new one
+            # Otherwise, create it the first time it is needed
             self.settings_window = SettingsWindow(self.root, self)
 
     def show_stats(self):
-        """Opens the statistics window."""
-        StatsWindow(self.root, self.app_data["sessions"])
+        """Opens the statistics window, reusing it if it was opened before."""
+        # If the stats window already exists, refresh it and bring it to the front
+        if self.stats_window and self.stats_window.winfo_exists():
+            self.stats_window.show()
+        else:
+            # Otherwise, create it the first time it is needed
+            self.stats_window = StatsWindow(self.root, self.app_data["sessions"])
 
     def reset_stats(self):
         """Clears all session data after user confirmation."""
@@ -444,15 +671,31 @@ class MainWindow:
         if messagebox.askyesno(cfg.STRINGS['title_reset_confirm'], cfg.STRINGS['msg_reset_confirm'], parent=self.root):
             # If they click "Yes", clear the list of sessions and save the change
             self.app_data["sessions"].clear()
+            self._dirty = True
             self._save_data()
 
     def refresh_quote(self, event=None):
-        """Fetches and displays a new motivational quote."""
-        self.quote_label.config(text=get_quote())
+        """Fetches a new motivational quote in the background and displays it when it arrives."""
+        # Ignore extra clicks while a quote is still on its way
+        if self._quote_future is not None:
+            return
+        # The current quote stays on screen until the new one is ready
+        self._quote_future = get_quote_async()
+        self._check_quote()
+
+    def _check_quote(self):
+        """Shows the fetched quote once it has arrived, checking again shortly until then."""
+        # The check runs on the tkinter thread, since only that thread may touch widgets
+        if self._quote_future.done():
+            self.quote_label.config(text=self._quote_future.result())
+            self._quote_future = None
+        else:
+            self.root.after(self.QUOTE_CHECK_MS, self._check_quote)
 
     def _update_loop(self):
-        """The main application loop, which runs every second."""
-        # Ask the timer to count down by one second
+        """The main application loop, which runs every second while the timer is running."""
+        self._update_job = None
+        # Ask the timer to catch up with the clock
         result = self.timer.tick()
 
         # 'result' will be None unless a session has just finished.
@@ -470,48 +713,56 @@ class MainWindow:
             if details:
                 messagebox.showinfo(details["title"], details["message"], parent=self.root)
                 if result == "work_complete":
-                    self.app_data["sessions"].append({"timestamp": datetime.now().isoformat()})
+                    now = datetime.now()
+                    self.app_data["sessions"].append({"timestamp": now.isoformat(), "date": [now.year, now.month, now.day]})
+                    # Keep the stats window's counts up to date as well
+                    if self.stats_window and self.stats_window.winfo_exists():
+                        self.stats_window.add_session(now.date())
+                    self._dirty = True
                     self._save_data()
                 if self.app_data["settings"]["auto_start"]:
                     self.timer.set_session(details["next"])
                     self.timer.start()
 
-        # After handling any logic, refresh the UI
+        # After handling any logic, refresh the UI and plan the next update
+        self._schedule_update()
+
+    def _schedule_update(self):
+        """Refreshes the UI and plans the next update, but only while the timer is running."""
+        # Cancel the update planned for the previous timer state
+        if self._update_job is not None:
+            self.root.after_cancel(self._update_job)
+            self._update_job = None
+
         self._update_ui()
-        # Tell tkinter to run this method again after 1000 milliseconds (1 second)
-        self.root.after(1000, self._update_loop)
+
+        # An idle or paused timer doesn't change, so there is nothing to wake up for
+        if self.timer.state == 'running':
+            # Wake up right when the displayed second changes (or the session ends). It is
+            # measured from the clock each time, so small delays never add up into drift.
+            seconds_to_next_change = (self.timer.exact_time_left() % 1) or 1.0
+            delay_ms = math.ceil(seconds_to_next_change * 1000)
+            self._update_job = self.root.after(delay_ms, self._update_loop)
 
     def _update_ui(self):
         """Refreshes the UI to reflect the current timer state."""
-        # Update the main timer display with the correctly formatted time
-        self.timer_display.config(text=format_time(self.timer.time_left))
-
-        # This dictionary maps the timer's state directly to the text needed for the labels and buttons
-        ui_map = {
-            'work_idle':    (cfg.STRINGS['status_ready'], cfg.STRINGS['btn_start_work'], cfg.STRINGS['btn_start_break']),
-            'work_running': (cfg.STRINGS['status_working'], cfg.STRINGS['btn_pause_work'], cfg.STRINGS['btn_start_break']),
-            'work_paused':  (cfg.STRINGS['status_work_paused'], cfg.STRINGS['btn_start_work'], cfg.STRINGS['btn_start_break']),
-            'break_idle':   (cfg.STRINGS['status_ready'], cfg.STRINGS['btn_start_work'], cfg.STRINGS['btn_start_break']),
-            'break_running':(cfg.STRINGS['status_break'], cfg.STRINGS['btn_start_work'], cfg.STRINGS['btn_pause_break']),
-            'break_paused': (cfg.STRINGS['status_break_paused'], cfg.STRINGS['btn_start_work'], cfg.STRINGS['btn_start_break']),
-        }
-
-        # Determine the correct key to look up in our map
-        session_category = 'work' if self.timer.session_type == 'work' else 'break'
-        state_key = f"{session_category}_{self.timer.state}"
-
-        # Get the tuple of texts for the current state
-        status_text, work_button_text, break_button_text = ui_map[state_key]
-
-        # Apply the new text to the UI widgets
-        self.status_label.config(text=status_text)
-        self.work_button.config(text=work_button_text)
-        self.break_button.config(text=break_button_text)
+        # Get the tuple of texts for the current session type and state
+        status_text, work_button_text, break_button_text = self._UI_MAP[(self.timer.session_type, self.timer.state)]
+        # The timer display shows the correctly formatted time
+        new_ui = (format_time(self.timer.time_left), status_text, work_button_text, break_button_text)
+
+        # Apply the new text only to the UI widgets whose text actually changed
+        widgets = (self.timer_display, self.status_label, self.work_button, self.break_button)
+        for widget, old_text, new_text in zip(widgets, self._last_ui, new_ui):
+            if new_text != old_text:
+                widget.config(text=new_text)
+        self._last_ui = new_ui
 
 # =================
 # APPLICATION USAGE
 # =================
 if __name__ == "__main__":
+    prefetch_quote()       # Start fetching the first quote while the window is being built
     root = tk.Tk()         # Create the main application window
     app = MainWindow(root) # Create an instance of our main application class, which builds the UI
     root.mainloop()        # Start the tkinter event loop to show the window and run the app
\ No newline at end of file
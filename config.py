@@ -6,12 +6,15 @@ change the app's look without needing to modify the core logic in 'app.py'.
 """
 
 import os
+from types import MappingProxyType
 
 # =============
 # 1. FILE PATHS
 # =============
 # The file where user settings and session history are stored
 DATA_FILE = os.path.join(os.path.dirname(__file__), "data.json")
+# The file where the last fetched quote is cached
+QUOTE_CACHE_FILE = os.path.join(os.path.dirname(__file__), "quote_cache.json")
 
 # =================
 # 2. TIMER DEFAULTS
@@ -45,7 +48,6 @@ FONT_SETTINGS_LABEL = ("Ubuntu", 11, "normal")
 FONT_SETTINGS_ENTRY = ("Ubuntu", 11, "normal")
 FONT_STATS_TITLE = ("Ubuntu", 14, "bold")
 FONT_STATS_DAY_LABEL = ("Ubuntu", 12, "normal")
-FONT_STATS_COUNT = ("Ubuntu", 12, "bold")
 FONT_STATS_TOTAL = ("Ubuntu", 14, "bold")
 FONT_STATS_NAV_BUTTON = ("Ubuntu", 12, "normal")
 
@@ -64,6 +66,9 @@ COLOR_STATS_NAV_BUTTON_FG = "black"
 # ======================
 # 6. UI STRINGS AND TEXT
 # ======================
+# The title shared by the session complete popups
+POPUP_TITLE = "Pomodoro"
+
 # All UI texts for easy modification
 STRINGS = {
     'title_main': "Pomodoro Timer",
@@ -96,20 +101,34 @@ STRINGS = {
     'settings_auto_start_format': "Auto Start: {}",
     'stats_date_range_format': "{start_date} - {end_date}",
     'stats_weekly_total_format': "Weekly Total: {} Pomodoros",
-    'stats_weekdays': ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    'stats_weekdays': ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
     'stats_session_icon': "🍅",
     'msg_work_complete': "Work session complete! Time for a break.",
     'msg_break_complete': "Break over! Back to work.",
     'msg_reset_confirm': "Are you sure you want to delete all your session data?",
-    'title_work_complete': "Pomodoro",
-    'title_break_complete': "Pomodoro",
+    'title_work_complete': POPUP_TITLE,
+    'title_break_complete': POPUP_TITLE,
     'title_reset_confirm': "Reset Stats",
     'title_file_error': "Data File Issue",
     'msg_file_created': f"Could not find '{os.path.basename(DATA_FILE)}'. A new one has been created.",
     'msg_file_corrupt': f"'{os.path.basename(DATA_FILE)}' was corrupted and has been reset.",
     'footer_text': "🍅 Pomodoro App\nMade by Mohamed Amine Aouini",
     'fallback_quote': "Stay focused and productive.",
+    'quote_loading': "Loading a quote...",
 }
+# The texts are read-only, so no part of the app can change them by accident
+STRINGS = MappingProxyType(STRINGS)
+
+# The main window switches between these texts while the timer runs, so they get their own names
+STATUS_READY = STRINGS['status_ready']
+STATUS_WORKING = STRINGS['status_working']
+STATUS_BREAK = STRINGS['status_break']
+STATUS_WORK_PAUSED = STRINGS['status_work_paused']
+STATUS_BREAK_PAUSED = STRINGS['status_break_paused']
+BTN_START_WORK = STRINGS['btn_start_work']
+BTN_PAUSE_WORK = STRINGS['btn_pause_work']
+BTN_START_BREAK = STRINGS['btn_start_break']
+BTN_PAUSE_BREAK = STRINGS['btn_pause_break']
 
 # ================
 # 7. WIDGET SIZING
@@ -119,34 +138,36 @@ SETTINGS_ENTRY_WIDTH = 5
 SETTINGS_BUTTON_WIDTH = 10
 MAIN_BUTTON_WIDTH = 10
 STATS_NAV_BUTTON_WIDTH = 13
-STATS_DAY_LABEL_WIDTH = 12
-STATS_COUNT_LABEL_WIDTH = 3
+STATS_TABLE_ROW_HEIGHT = 26
+STATS_DAY_COLUMN_WIDTH = 164
+STATS_COUNT_COLUMN_WIDTH = 60
+STATS_ICON_COLUMN_WIDTH = 80
 
 # =========================
 # 8. UI PADDING AND SPACING
 # =========================
+# The padding values are read-only, so one window can't accidentally change another's layout
+
 # Main Window
-MAIN_FRAME_PADDING = {'pady': (10, 10)}
-MAIN_STATUS_PADDING = {'pady': (0, 0)}
-MAIN_BUTTON_FRAME_PADDING = {'pady': (0, 0)}
-MAIN_BUTTON_PADDING = {'padx': 0, 'pady': 0}
-MAIN_QUOTE_PADDING = {'padx': 0, 'pady': (15, 15)}
-MAIN_FOOTER_PADDING = {'side': 'bottom', 'pady': 10}
+MAIN_FRAME_PADDING = MappingProxyType({'pady': (10, 10)})
+MAIN_STATUS_PADDING = MappingProxyType({'pady': (0, 0)})
+MAIN_BUTTON_FRAME_PADDING = MappingProxyType({'pady': (0, 0)})
+MAIN_BUTTON_PADDING = MappingProxyType({'padx': 0, 'pady': 0})
+MAIN_QUOTE_PADDING = MappingProxyType({'padx': 0, 'pady': (15, 15)})
+MAIN_FOOTER_PADDING = MappingProxyType({'side': 'bottom', 'pady': 10})
 
 # Settings Window
-SETTINGS_MAIN_FRAME_PADDING = {'pady': 10, 'padx': 10}
-SETTINGS_DURATIONS_FRAME_PADDING = {'pady': 0}
-SETTINGS_DURATIONS_GRID_PADDING = {'padx': 0, 'pady': 0}
-SETTINGS_CONTROLS_FRAME_PADDING = {'pady': 6}
-SETTINGS_ACTIONS_FRAME_PADDING = {'pady': 0}
-SETTINGS_BUTTON_INTERNAL_PADDING = {'padx': 0}
+SETTINGS_MAIN_FRAME_PADDING = MappingProxyType({'pady': 10, 'padx': 10})
+SETTINGS_DURATIONS_FRAME_PADDING = MappingProxyType({'pady': 0})
+SETTINGS_DURATIONS_GRID_PADDING = MappingProxyType({'padx': 0, 'pady': 0})
+SETTINGS_CONTROLS_FRAME_PADDING = MappingProxyType({'pady': 6})
+SETTINGS_ACTIONS_FRAME_PADDING = MappingProxyType({'pady': 0})
+SETTINGS_BUTTON_INTERNAL_PADDING = MappingProxyType({'padx': 0})
 
 # Stats Window
-STATS_NAV_FRAME_PADDING = {'pady': (0, 0), 'padx': 0}
-STATS_NAV_BUTTON_PADDING = {'pady': (0, 0), 'padx': 0}
-STATS_TITLE_PADDING = {'pady': (0, 0), 'padx': 0}
-STATS_DAYS_FRAME_PADDING = {'pady': (0, 8), 'padx': 8}
-STATS_DAY_ROW_PADDING = {'pady': (2, 2), 'padx': 2}
-STATS_TOTAL_FRAME_PADDING = {'pady': (0, 0), 'padx': 0}
-STATS_TOTAL_BANNER_PADDING = {'pady': (0, 8), 'padx': 8}
-STATS_ROW_INTERNAL_PADDING_X = 10
\ No newline at end of file
+STATS_NAV_FRAME_PADDING = MappingProxyType({'pady': (0, 0), 'padx': 0})
+STATS_NAV_BUTTON_PADDING = MappingProxyType({'pady': (0, 0), 'padx': 0})
+STATS_TITLE_PADDING = MappingProxyType({'pady': (0, 0), 'padx': 0})
+STATS_DAYS_FRAME_PADDING = MappingProxyType({'pady': (0, 8), 'padx': 8})
+STATS_TOTAL_FRAME_PADDING = MappingProxyType({'pady': (0, 0), 'padx': 0})
+STATS_TOTAL_BANNER_PADDING = MappingProxyType({'pady': (0, 8), 'padx': 8})
\ No newline at end of file
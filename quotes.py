@@ -1,23 +1,163 @@
 """
-Fetches motivational quotes from ZenQuotes API.
-Includes a fallback mechanism in case the API is unavailable.
+Fetches motivational quotes from ZenQuotes API on a background thread.
+Quotes are fetched in batches and handed out one at a time as Futures.
+Includes a fallback mechanism in case the API is unavailable, and a small
+cache file so the unused quotes survive a restart and work offline.
 """
-import requests
-from config import STRINGS
+import atexit
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-def get_quote():
-    """Gets a motivational quote from ZenQuotes API or returns a fallback from config."""
+from config import QUOTE_CACHE_FILE, STRINGS
+
+# orjson is optional, when installed it parses the API response faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One shared session keeps the connection to the API open between requests, so later
+# quotes skip the DNS lookup and TLS handshake. It's created the first time it's needed.
+_session = None
+
+def _get_session():
+    """Returns the shared requests session, creating it on first use."""
+    global _session
+    if _session is None:
+        # Importing requests takes a while, so it's only done once the API is really needed
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        # A failed connection is retried once, but a slow or failed response is not,
+        # so a request never waits longer than the old 3 second timeout allowed
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2,
+                                              max_retries=Retry(total=1, connect=1, read=0, status=0)))
+        _session = session
+    return _session
+
+def _load_cache():
+    """Reads the quote cache file, or returns an empty cache if it is missing or broken."""
+    try:
+        with open(QUOTE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # The file is only a speed-up, so anything with the wrong shape is ignored rather than trusted
+    if not isinstance(cache, dict) or not isinstance(cache.get("pool", []), list):
+        return {}
+    # A broken batch or validators would make every refill fail, so they are dropped instead
+    if not isinstance(cache.get("batch", []), list):
+        cache.pop("batch")
+    validators = cache.get("validators", {})
+    if not (isinstance(validators, dict) and all(isinstance(key, str) and isinstance(value, str)
+                                                 for key, value in validators.items())):
+        cache.pop("validators")
+    return cache
+
+def _save_cache():
+    """Writes the quote cache file. Errors are ignored, since the cache is only a speed-up."""
+    _cache["pool"] = list(_pool)
     try:
-        # Attempt to get a random quote from the API
-        response = requests.get("https://zenquotes.io/api/random", timeout=3)
+        # Write to a temporary file first and then swap it in, like the data file
+        temp_file = QUOTE_CACHE_FILE + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(_cache, f)
+        os.replace(temp_file, QUOTE_CACHE_FILE)
+    except OSError:
+        pass
+
+# The last quote that was handed out, the last batch from the API (with its ETag
+# and Last-Modified headers) and the quotes from it that are not used yet
+_cache = _load_cache()
+_pool = deque(_cache.get("pool", []))
+# Keep the unused quotes for the next launch
+atexit.register(_save_cache)
+
+# After this many failed requests in a row, the API is not tried again for RETRY_COOLDOWN seconds
+MAX_FAILURES = 2
+RETRY_COOLDOWN = 5 * 60
+_failures = 0
+_retry_after = 0.0   # The time.monotonic() before which the API is not tried
+
+# The background thread for fetching, and the quote prefetched for the first request (if any)
+_executor = ThreadPoolExecutor(max_workers=1)
+_prefetched = None
+
+def prefetch_quote():
+    """Starts fetching a quote in the background, so it's ready by the time the UI asks for it."""
+    global _prefetched
+    _prefetched = _executor.submit(_fetch_quote)
+
+def get_quote_async():
+    """Starts getting a new motivational quote in the background and returns its Future."""
+    global _prefetched
+    # Hand out the prefetched quote first, whether or not it has arrived yet
+    if _prefetched is not None:
+        future, _prefetched = _prefetched, None
+        return future
+    return _executor.submit(_fetch_quote)
+
+def _fetch_quote():
+    """Takes the next quote from the batch, refilling it from the API when it's empty."""
+    try:
+        if not _pool:
+            # After repeated failures the API is left alone for a while, instead of waiting on it for every quote
+            if time.monotonic() < _retry_after:
+                raise ConnectionError("ZenQuotes API is unavailable, not retrying yet")
+            _refill_pool()
+
+        # Format the next quote
+        quote_data = _pool.popleft()
+        quote = f'"{quote_data["q"]}"\n- {quote_data["a"]}'
+
+    except Exception:
+        # Returns the last quote, or the fallback quote if there is none yet
+        return _cache.get("quote", STRINGS['fallback_quote'])
+
+    _cache["quote"] = quote
+    return quote
+
+def _refill_pool():
+    """Gets a new batch of quotes from the API, keeping count of failed attempts."""
+    global _failures, _retry_after
+    try:
+        # If we still have the last batch, the API can skip sending it again when it hasn't changed
+        headers = _cache.get("validators", {}) if "batch" in _cache else {}
+
+        # Attempt to get a batch of quotes (around 50) from the API in a single request
+        # (connect timeout, read timeout): two connection attempts still fit in 3 seconds
+        response = _get_session().get("https://zenquotes.io/api/quotes", headers=headers, timeout=(1.5, 3))
 
         # Check if the request was successful
         response.raise_for_status()
 
-        # Parse the response and format the quote
-        quote_data = response.json()[0]
-        return f'"{quote_data["q"]}"\n- {quote_data["a"]}'
+        if response.status_code == 304:
+            # Not modified, so the last batch is used again
+            batch = _cache["batch"]
+        else:
+            # Parse the raw response bytes and remember how to ask for them again
+            batch = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
+            validators = {"If-None-Match": response.headers.get("ETag"),
+                          "If-Modified-Since": response.headers.get("Last-Modified")}
+            _cache["batch"] = batch
+            _cache["validators"] = {key: value for key, value in validators.items() if value}
 
     except Exception:
-        # Returns the fallback quote if any error occurs
-        return STRINGS['fallback_quote']
\ No newline at end of file
+        # Too many failures in a row means the API (or the network) is down, so take a break from it
+        _failures += 1
+        if _failures >= MAX_FAILURES:
+            _retry_after = time.monotonic() + RETRY_COOLDOWN
+        raise
+
+    # It worked, so start counting failures from zero again
+    _failures = 0
+    _retry_after = 0.0
+
+    # Keep the quotes for the next calls
+    _pool.extend(batch)
+    _save_cache()